@@ -12,10 +12,11 @@ from __future__ import annotations
 
 import random
 import typing
+from collections import deque
 from dataclasses import dataclass
 
 import terminaltexteffects.utils.argvalidators as argvalidators
-from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
 from terminaltexteffects.engine.terminal import Terminal
 from terminaltexteffects.utils import easing
@@ -23,11 +24,87 @@ from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, arg
 from terminaltexteffects.utils.geometry import Coord
 from terminaltexteffects.utils.graphics import Color, Gradient
 
+# binary strings by symbol, shared by all representations of the same symbol. Single byte code points are built at
+# import and any other symbols are added the first time they're seen.
+_BINARY_STRINGS: dict[str, str] = {chr(code_point): format(code_point, "08b") for code_point in range(256)}
+
 
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
     return BinaryPath, BinaryPathConfig
 
 
+def _remove_inactive(items: list) -> None:
+    """Removes inactive items from the list in place by swapping them with the last remaining item. Order is not preserved.
+
+    Args:
+        items (list): list of items with an is_active attribute
+    """
+    index = 0
+    remaining = len(items)
+    while index < remaining:
+        if items[index].is_active:
+            index += 1
+        else:
+            remaining -= 1
+            items[index] = items[remaining]
+    del items[remaining:]
+
+
+def _build_path(
+    start_column: int, start_row: int, target_column: int, target_row: int, max_row_step: int, max_column_step: int = 4
+) -> list[Coord]:
+    """Builds a path of right angle moves from the start to the target. Moves alternate between the column and row axis,
+    starting with a random axis, and travel a random distance towards the target limited by the step size for the axis.
+
+    The walk only operates on ints bound to local names. Coords are built once the walk is complete.
+
+    Args:
+        start_column (int): starting column
+        start_row (int): starting row
+        target_column (int): target column
+        target_row (int): target row
+        max_row_step (int): maximum distance of a single move along the row axis
+        max_column_step (int, optional): maximum distance of a single move along the column axis. Defaults to 4.
+
+    Returns:
+        list[Coord]: coordinates for the path waypoints, beginning with the start and ending with the target. Consecutive
+            waypoints are never equal or collinear.
+    """
+    randint = random.randint
+    # per axis step limits, indexed by axis (0: column, 1: row)
+    axis_step_limits = (max_column_step, max_row_step)
+    target_point = (target_column, target_row)
+    path_points: list[tuple[int, int]] = [(start_column, start_row)]
+    # the axis to move along next, toggled after each move
+    axis = random.getrandbits(1)
+    next_point = path_points[-1]
+    while next_point != target_point:
+        last_point = next_point
+        remaining_distance = target_point[axis] - last_point[axis]
+        if remaining_distance:
+            step = randint(1, min(abs(remaining_distance), axis_step_limits[axis])) * (
+                (remaining_distance > 0) - (remaining_distance < 0)
+            )
+            next_point = (last_point[0] + step * (1 - axis), last_point[1] + step * axis)
+            axis ^= 1
+        else:
+            next_point = target_point
+
+        # every move heads towards the target, so a move along the same axis as the previous move extends the previous
+        # segment and the previous waypoint can be dropped without changing the motion
+        if len(path_points) > 1:
+            previous_point = path_points[-2]
+            if (
+                previous_point[0] == last_point[0] == next_point[0]
+                or previous_point[1] == last_point[1] == next_point[1]
+            ):
+                path_points[-1] = next_point
+                continue
+        path_points.append(next_point)
+
+    return [Coord(column, row) for column, row in path_points]
+
+
 @argclass(
     name="binarypath",
     help="Binary representations of each character move through the terminal towards the home coordinate of the character.",
@@ -116,17 +193,38 @@ class BinaryPathConfig(ArgsDataClass):
 
 class BinaryPathIterator(BaseEffectIterator[BinaryPathConfig]):
     class _BinaryRepresentation:
+        __slots__ = (
+            "character",
+            "terminal",
+            "binary_string",
+            "binary_characters",
+            "pending_binary_characters",
+            "input_coord",
+            "is_active",
+            "_arrived_count",
+            "_expected_count",
+        )
+
         def __init__(self, character: EffectCharacter, terminal: Terminal):
             self.character = character
             self.terminal = terminal
-            self.binary_string = format(ord(self.character.animation.current_character_visual.symbol), "08b")
+            symbol = self.character.animation.current_character_visual.symbol
+            binary_string = _BINARY_STRINGS.get(symbol)
+            if binary_string is None:
+                binary_string = _BINARY_STRINGS[symbol] = format(ord(symbol), "08b")
+            self.binary_string = binary_string
             self.binary_characters: list[EffectCharacter] = []
-            self.pending_binary_characters: list[EffectCharacter] = []
+            self.pending_binary_characters: deque[EffectCharacter] = deque()
             self.input_coord = self.character.input_coord
             self.is_active = False
+            self._arrived_count = 0
+            self._expected_count = len(self.binary_string)
 
         def _travel_complete(self) -> bool:
-            return all(bin_char.motion.current_coord == self.input_coord for bin_char in self.binary_characters)
+            return self._arrived_count >= self._expected_count
+
+        def _register_arrival(self, _: EffectCharacter) -> None:
+            self._arrived_count += 1
 
         def _deactivate(self) -> None:
             for bin_char in self.binary_characters:
@@ -145,141 +243,143 @@ class BinaryPathIterator(BaseEffectIterator[BinaryPathConfig]):
         self.last_frame_provided = False
         self.active_binary_reps: list[BinaryPathIterator._BinaryRepresentation] = []
         self.complete = False
-        self.phase = "travel"
-        self.final_wipe_chars = self.terminal.get_characters_grouped(
-            grouping=self.terminal.CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT
+        # the active phase step, swapped from _step_travel to _step_wipe when the travel phase is complete
+        self._step: typing.Callable[[], None] = self._step_travel
+        self.final_wipe_chars: deque[list[EffectCharacter]] = deque(
+            self.terminal.get_characters_grouped(
+                grouping=self.terminal.CharacterGroup.DIAGONAL_TOP_RIGHT_TO_BOTTOM_LEFT
+            )
         )
         self.max_active_binary_groups: int = 0
         self.build()
 
     def build(self) -> None:
         final_gradient = Gradient(*self.config.final_gradient_stops, steps=self.config.final_gradient_steps)
-        final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
-            self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
-        )
-        for character in self.terminal.get_characters():
-            self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
-
-        for character in self.terminal.get_characters():
+        input_characters = self.terminal.get_characters()
+        # only evaluate the gradient at the input character coordinates rather than mapping the entire canvas
+        self.character_final_color_map = {
+            character: final_gradient.get_color_at_coordinate(
+                self.terminal.canvas.top,
+                self.terminal.canvas.right,
+                character.input_coord,
+                self.config.final_gradient_direction,
+            )
+            for character in input_characters
+        }
+
+        for character in input_characters:
             bin_rep = BinaryPathIterator._BinaryRepresentation(character, self.terminal)
             for binary_char in bin_rep.binary_string:
                 bin_rep.binary_characters.append(self.terminal.add_character(binary_char, Coord(0, 0)))
                 bin_rep.pending_binary_characters.append(bin_rep.binary_characters[-1])
             self.pending_binary_representations.append(bin_rep)
 
+        max_row_step = max(10, int(self.terminal.canvas.right * 0.2))
+        # draw the color for every binary character in a single call
+        binary_colors = iter(
+            random.choices(
+                self.config.binary_colors,
+                k=sum(len(bin_rep.binary_characters) for bin_rep in self.pending_binary_representations),
+            )
+        )
         for bin_rep in self.pending_binary_representations:
-            path_coords: list[Coord] = []
+            target_coord = bin_rep.character.input_coord
             starting_coord = self.terminal.canvas.random_coord(outside_scope=True)
-            path_coords.append(starting_coord)
-            last_orientation = random.choice(("col", "row"))
-            while path_coords[-1] != bin_rep.character.input_coord:
-                last_coord = path_coords[-1]
-                if last_coord.column > bin_rep.character.input_coord.column:
-                    column_direction = -1
-                elif last_coord.column == bin_rep.character.input_coord.column:
-                    column_direction = 0
-                else:
-                    column_direction = 1
-                if last_coord.row > bin_rep.character.input_coord.row:
-                    row_direction = -1
-                elif last_coord.row == bin_rep.character.input_coord.row:
-                    row_direction = 0
-                else:
-                    row_direction = 1
-                max_column_distance = abs(last_coord.column - bin_rep.character.input_coord.column)
-                max_row_distance = abs(last_coord.row - bin_rep.character.input_coord.row)
-                if last_orientation == "col" and max_row_distance > 0:
-                    next_coord = Coord(
-                        last_coord.column,
-                        last_coord.row
-                        + (
-                            random.randint(1, min(max_row_distance, max(10, int(self.terminal.canvas.right * 0.2))))
-                            * row_direction
-                        ),
-                    )
-                    last_orientation = "row"
-                elif last_orientation == "row" and max_column_distance > 0:
-                    next_coord = Coord(
-                        last_coord.column + (random.randint(1, min(max_column_distance, 4)) * column_direction),
-                        last_coord.row,
-                    )
-                    last_orientation = "col"
-                else:
-                    next_coord = bin_rep.character.input_coord
-
-                path_coords.append(next_coord)
-
-            path_coords.append(next_coord)
-            final_coord = bin_rep.character.input_coord
-            path_coords.append(final_coord)
+            path_coords = _build_path(
+                starting_coord.column, starting_coord.row, target_coord.column, target_coord.row, max_row_step
+            )
             for bin_effectchar in bin_rep.binary_characters:
                 bin_effectchar.motion.set_coordinate(path_coords[0])
                 digital_path = bin_effectchar.motion.new_path(speed=self.config.movement_speed)
-                for coord in path_coords:
-                    digital_path.new_waypoint(coord)
+                digital_path.extend_waypoints(path_coords)
+                bin_effectchar.event_handler.register_event(
+                    EventHandler.Event.PATH_COMPLETE,
+                    digital_path,
+                    EventHandler.Action.CALLBACK,
+                    EventHandler.Callback(bin_rep._register_arrival),
+                )
                 bin_effectchar.motion.activate_path(digital_path)
                 bin_effectchar.layer = 1
                 color_scn = bin_effectchar.animation.new_scene()
                 color_scn.add_frame(
                     bin_effectchar.animation.current_character_visual.symbol,
                     1,
-                    color=random.choice(self.config.binary_colors),
+                    color=next(binary_colors),
                 )
                 bin_effectchar.animation.activate_scene(color_scn)
 
-        for character in self.terminal.get_characters():
+        gradients_by_final_color: dict[Color, tuple[Gradient, Gradient]] = {}
+        for character in input_characters:
+            final_color = self.character_final_color_map[character]
+            if final_color not in gradients_by_final_color:
+                dim_color = character.animation.adjust_color_brightness(final_color, 0.5)
+                gradients_by_final_color[final_color] = (
+                    Gradient(Color("ffffff"), dim_color, steps=10),
+                    Gradient(dim_color, final_color, steps=10),
+                )
+            dim_gradient, brighten_gradient = gradients_by_final_color[final_color]
             collapse_scn = character.animation.new_scene(ease=easing.in_quad, id="collapse_scn")
-            dim_color = character.animation.adjust_color_brightness(self.character_final_color_map[character], 0.5)
-            dim_gradient = Gradient(Color("ffffff"), dim_color, steps=10)
             collapse_scn.apply_gradient_to_symbols(dim_gradient, character.input_symbol, 7)
 
             brighten_scn = character.animation.new_scene(id="brighten_scn")
-            brighten_gradient = Gradient(dim_color, self.character_final_color_map[character], steps=10)
             brighten_scn.apply_gradient_to_symbols(brighten_gradient, character.input_symbol, 2)
+        # shuffle once so random activation order can be consumed with O(1) pops from the end
+        random.shuffle(self.pending_binary_representations)
         self.max_active_binary_groups = max(
             1, int(self.config.active_binary_groups * len(self.pending_binary_representations))
         )
 
+    def update(self) -> None:
+        """Run the tick method for all active characters and remove inactive characters from the active list in place."""
+        for character in self.active_characters:
+            character.tick()
+        _remove_inactive(self.active_characters)
+
+    def _step_travel(self) -> None:
+        """Activate pending binary representations and advance the active ones. Switches to the wipe phase once all
+        characters have finished traveling."""
+        activation_count = min(
+            self.max_active_binary_groups - len(self.active_binary_reps), len(self.pending_binary_representations)
+        )
+        if activation_count > 0:
+            # the pending list is shuffled in build(), activate a batch from the end in a single slice
+            next_binary_reps = self.pending_binary_representations[-activation_count:]
+            del self.pending_binary_representations[-activation_count:]
+            for next_binary_rep in next_binary_reps:
+                next_binary_rep.is_active = True
+            self.active_binary_reps.extend(next_binary_reps)
+
+        if self.active_binary_reps:
+            for active_rep in self.active_binary_reps:
+                if active_rep.pending_binary_characters:
+                    next_char = active_rep.pending_binary_characters.popleft()
+                    self.active_characters.append(next_char)
+                    self.terminal.set_character_visibility(next_char, True)
+                elif active_rep._travel_complete():
+                    active_rep._deactivate()
+                    active_rep._activate_source_character()
+                    self.active_characters.append(active_rep.character)
+
+            _remove_inactive(self.active_binary_reps)
+
+        if not self.active_characters:
+            self._step = self._step_wipe
+            self._step_wipe()
+
+    def _step_wipe(self) -> None:
+        """Brighten the next diagonal group of characters. Marks the effect complete once all groups are active."""
+        if self.final_wipe_chars:
+            next_group = self.final_wipe_chars.popleft()
+            for character in next_group:
+                character.animation.activate_scene(character.animation.query_scene("brighten_scn"))
+                self.terminal.set_character_visibility(character, True)
+                self.active_characters.append(character)
+        else:
+            self.complete = True
+
     def __next__(self) -> str:
         if not self.complete or self.active_characters:
-            if self.phase == "travel":
-                while (
-                    len(self.active_binary_reps) < self.max_active_binary_groups and self.pending_binary_representations
-                ):
-                    next_binary_rep = self.pending_binary_representations.pop(
-                        random.randrange(len(self.pending_binary_representations))
-                    )
-                    next_binary_rep.is_active = True
-                    self.active_binary_reps.append(next_binary_rep)
-
-                if self.active_binary_reps:
-                    for active_rep in self.active_binary_reps:
-                        if active_rep.pending_binary_characters:
-                            next_char = active_rep.pending_binary_characters.pop(0)
-                            self.active_characters.append(next_char)
-                            self.terminal.set_character_visibility(next_char, True)
-                        elif active_rep._travel_complete():
-                            active_rep._deactivate()
-                            active_rep._activate_source_character()
-                            self.active_characters.append(active_rep.character)
-
-                    self.active_binary_reps = [
-                        binary_rep for binary_rep in self.active_binary_reps if binary_rep.is_active
-                    ]
-
-                if not self.active_characters:
-                    self.phase = "wipe"
-
-            if self.phase == "wipe":
-                if self.final_wipe_chars:
-                    next_group = self.final_wipe_chars.pop(0)
-                    for character in next_group:
-                        character.animation.activate_scene(character.animation.query_scene("brighten_scn"))
-                        self.terminal.set_character_visibility(character, True)
-                        self.active_characters.append(character)
-                else:
-                    self.complete = True
-
+            self._step()
             self.update()
             return self.frame
 
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
+import math
 import random
+import sys
 import time
 import typing
-from collections import namedtuple
+from collections import deque
 from dataclasses import dataclass
 
 import terminaltexteffects.utils.argvalidators as argvalidators
@@ -70,11 +73,60 @@ MATRIX_SYMBOLS_KATA = (
     "ﾜ",
 )
 
+# concatenated once at import and interned so symbol comparisons in the rain loop can short circuit on identity
+_MATRIX_SYMBOLS = tuple(sys.intern(symbol) for symbol in MATRIX_SYMBOLS_COMMON + MATRIX_SYMBOLS_KATA)
+
 
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
     return Dev, DevConfig
 
 
+# natural log of the probability that a visible rain character keeps its symbol/color on a given frame
+_SYMBOL_KEEP_LOG = math.log(1.0 - 0.005)
+_COLOR_KEEP_LOG = math.log(1.0 - 0.001)
+
+
+def _sample_indices(count: int, miss_log: float) -> list[int]:
+    """Returns the indices in range(count) that pass an independent random trial.
+
+    Rather than drawing a random number for every index, the gap between passing indices is drawn from the geometric
+    distribution. The result is statistically identical while only drawing one random number per passing index.
+
+    Args:
+        count (int): number of indices to sample from
+        miss_log (float): natural log of the probability that an index does not pass, precomputed so the per call work
+            is limited to a single random draw and log for each passing index
+
+    Returns:
+        list[int]: passing indices in ascending order
+    """
+    indices: list[int] = []
+    if not count:
+        return indices
+    log = math.log
+    rand = random.random
+    index = int(log(1.0 - rand()) / miss_log)
+    while index < count:
+        indices.append(index)
+        index += 1 + int(log(1.0 - rand()) / miss_log)
+    return indices
+
+
+@functools.lru_cache(maxsize=4096)
+def _coord(column: int, row: int) -> Coord:
+    """Returns a Coord for the column and row. Coords are immutable, so instances are cached and shared rather than
+    allocated every time a rain column drops.
+
+    Args:
+        column (int): column of the coordinate
+        row (int): row of the coordinate
+
+    Returns:
+        Coord: the coordinate
+    """
+    return Coord(column, row)
+
+
 @argclass(
     name="dev",
     help="effect_description",
@@ -107,7 +159,7 @@ class DevConfig(ArgsDataClass):
         cmd_name=["--rain-symbols"],
         nargs="+",
         type_parser=argvalidators.Symbol.type_parser,
-        default=MATRIX_SYMBOLS_COMMON + MATRIX_SYMBOLS_KATA,
+        default=_MATRIX_SYMBOLS,
         metavar=argvalidators.Symbol.METAVAR,
         help="Space separated, unquoted, list of symbols to use for the rain.",
     )  # type: ignore[assignment]
@@ -176,10 +228,30 @@ class DevConfig(ArgsDataClass):
 
 
 class DevIterator(BaseEffectIterator[DevConfig]):
-    RAIN_COLORS = Gradient(*DevConfig.rain_color_gradient, steps=6)
-    CharacterAppearance = namedtuple("CharacterAppearance", ["color", "symbol"])
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def rain_colors(cls) -> list[Color]:
+        """Returns the rain color spectrum. The spectrum is built on first use, rather than at import, and cached.
+
+        Returns:
+            list[Color]: colors available to the rain characters
+        """
+        return Gradient(*DevConfig.rain_color_gradient, steps=6).spectrum
 
     class RainColumn:
+        __slots__ = (
+            "terminal",
+            "config",
+            "characters",
+            "pending_characters",
+            "matrix_symbols",
+            "visible_characters",
+            "base_rain_fall_delay",
+            "random_rain_fall_delay",
+            "length",
+            "hold_time",
+        )
+
         def __init__(
             self,
             characters: list[EffectCharacter],
@@ -189,16 +261,16 @@ class DevIterator(BaseEffectIterator[DevConfig]):
             self.terminal = terminal
             self.config = config
             self.characters: list[EffectCharacter] = characters
-            self.pending_characters: list[EffectCharacter] = []
+            self.pending_characters: deque[EffectCharacter] = deque()
             self.matrix_symbols: tuple[str, ...] = config.rain_symbols
             self.setup_column()
 
         def setup_column(self) -> None:
+            self.terminal.set_characters_visibility(self.characters, False)
+            self.pending_characters.extend(self.characters)
             for character in self.characters:
-                self.terminal.set_character_visibility(character, False)
-                self.pending_characters.append(character)
                 character.motion.current_coord = character.input_coord
-            self.visible_characters: list[EffectCharacter] = []
+            self.visible_characters: deque[EffectCharacter] = deque()
             self.base_rain_fall_delay = random.randint(self.config.rain_fall_delay[0], self.config.rain_fall_delay[1])
             self.random_rain_fall_delay = 0
             self.length = random.randint(max(1, int(len(self.characters) * 0.1)), len(self.characters))
@@ -207,56 +279,58 @@ class DevIterator(BaseEffectIterator[DevConfig]):
                 self.hold_time = random.randint(20, 45)
 
         def trim_column(self) -> None:
-            popped_char = self.visible_characters.pop(0)
+            popped_char = self.visible_characters.popleft()
             self.terminal.set_character_visibility(popped_char, False)
             if len(self.visible_characters) > 1:
                 self.fade_last_character()
 
         def drop_column(self) -> None:
             for character in self.visible_characters:
-                character.motion.current_coord = Coord(
-                    character.motion.current_coord.column, character.motion.current_coord.row - 1
-                )
+                current_coord = character.motion.current_coord
+                character.motion.current_coord = _coord(current_coord.column, current_coord.row - 1)
 
         def fade_last_character(self) -> None:
-            darker_color = Animation.adjust_color_brightness(random.choice(DevIterator.RAIN_COLORS[-3:]), 0.65)  # type: ignore
+            darker_color = Animation.adjust_color_brightness(random.choice(DevIterator.rain_colors()[-3:]), 0.65)
             self.visible_characters[0].animation.set_appearance(
                 self.visible_characters[0].animation.current_character_visual.symbol, darker_color
             )
 
         def tick(self) -> None:
+            # attributes used repeatedly below are bound to locals once per tick
+            visible_characters = self.visible_characters
             if not self.random_rain_fall_delay:
+                highlight_color = self.config.highlight_color
+                rain_colors = DevIterator.rain_colors()
+                choice = random.choice
                 if self.pending_characters:
-                    next_char = self.pending_characters.pop(0)
-                    next_char.animation.set_appearance(random.choice(self.matrix_symbols), self.config.highlight_color)
-                    previous_character = self.visible_characters[-1] if self.visible_characters else None
+                    next_char = self.pending_characters.popleft()
+                    next_char.animation.set_appearance(choice(self.matrix_symbols), highlight_color)
+                    previous_character = visible_characters[-1] if visible_characters else None
                     # if there is a previous character, remove the highlight
                     if previous_character:
-                        previous_character.animation.set_appearance(
-                            previous_character.animation.current_character_visual.symbol,
-                            random.choice(DevIterator.RAIN_COLORS),
-                        )
+                        previous_visual = previous_character.animation.current_character_visual
+                        rain_color = choice(rain_colors)
+                        if rain_color != previous_visual.color:
+                            previous_character.animation.set_appearance(previous_visual.symbol, rain_color)
                     self.terminal.set_character_visibility(next_char, True)
-                    self.visible_characters.append(next_char)
+                    visible_characters.append(next_char)
 
                 # if no pending characters, but still visible characters, trim the column
                 # unless the column is the full height of the canvas, then respect the hold
                 # time before trimming
                 else:
-                    if self.visible_characters:
+                    if visible_characters:
                         # adjust the bottom character color to remove the lightlight.
                         # always do this on the first hold frame, then
                         # randomly adjust the bottom character's color
                         # this is separately handled from the rest to prevent the
                         # highlight color from being replaced before appropriate
-                        if (
-                            self.visible_characters[-1].animation.current_character_visual.color
-                            == self.config.highlight_color
-                        ):
-                            self.visible_characters[-1].animation.set_appearance(
-                                self.visible_characters[-1].animation.current_character_visual.symbol,
-                                random.choice(DevIterator.RAIN_COLORS),
-                            )
+                        bottom_animation = visible_characters[-1].animation
+                        bottom_visual = bottom_animation.current_character_visual
+                        if bottom_visual.color == highlight_color:
+                            rain_color = choice(rain_colors)
+                            if rain_color != bottom_visual.color:
+                                bottom_animation.set_appearance(bottom_visual.symbol, rain_color)
 
                         if self.hold_time:
                             self.hold_time -= 1
@@ -266,7 +340,7 @@ class DevIterator(BaseEffectIterator[DevConfig]):
                             self.trim_column()
 
                 # if the column is longer than the preset length while still adding characters, trim it
-                if len(self.visible_characters) > self.length:
+                if len(visible_characters) > self.length:
                     self.trim_column()
                 self.random_rain_fall_delay = self.base_rain_fall_delay
 
@@ -274,17 +348,25 @@ class DevIterator(BaseEffectIterator[DevConfig]):
                 self.random_rain_fall_delay -= 1
 
             # randomly change the symbol and/or color of the characters
-            next_color: Color | None
-            for character in self.visible_characters:
-                if random.random() < 0.005:
-                    next_symbol = random.choice(self.matrix_symbols)
-                else:
-                    next_symbol = character.animation.current_character_visual.symbol
-                if random.random() < 0.001:
-                    next_color = random.choice(DevIterator.RAIN_COLORS)
-                else:
-                    next_color = character.animation.current_character_visual.color
-                character.animation.set_appearance(next_symbol, next_color)
+            # characters that are not selected keep their appearance and are skipped entirely
+            visible_count = len(visible_characters)
+            symbol_change_indices = _sample_indices(visible_count, _SYMBOL_KEEP_LOG)
+            color_change_indices = _sample_indices(visible_count, _COLOR_KEEP_LOG)
+            # most frames select no characters, otherwise draw the new symbols and colors in one batch each
+            if symbol_change_indices or color_change_indices:
+                next_symbols = dict(
+                    zip(symbol_change_indices, random.choices(self.matrix_symbols, k=len(symbol_change_indices)))
+                )
+                next_colors = dict(
+                    zip(color_change_indices, random.choices(DevIterator.rain_colors(), k=len(color_change_indices)))
+                )
+                for index in next_symbols.keys() | next_colors.keys():
+                    character_animation = visible_characters[index].animation
+                    current_visual = character_animation.current_character_visual
+                    next_symbol = next_symbols.get(index, current_visual.symbol)
+                    next_color = next_colors.get(index, current_visual.color)
+                    if next_symbol != current_visual.symbol or next_color != current_visual.color:
+                        character_animation.set_appearance(next_symbol, next_color)
 
     def __init__(self, effect: Dev) -> None:
         super().__init__(effect)
@@ -304,9 +386,13 @@ class DevIterator(BaseEffectIterator[DevConfig]):
         final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
+        resolve_gradients: dict[Color, Gradient] = {}
         for character in self.terminal.get_characters():
+            final_color = final_gradient_mapping[character.input_coord]
+            if final_color not in resolve_gradients:
+                resolve_gradients[final_color] = Gradient(self.config.highlight_color, final_color, steps=8)
             resolve_scn = character.animation.new_scene(id="resolve")
-            for color in Gradient(self.config.highlight_color, final_gradient_mapping[character.input_coord], steps=8):
+            for color in resolve_gradients[final_color]:
                 resolve_scn.add_frame(character.input_symbol, self.config.final_gradient_frames, color=color)
 
         for column_chars in self.terminal.get_characters_grouped(
@@ -314,25 +400,28 @@ class DevIterator(BaseEffectIterator[DevConfig]):
         ):
             column_chars.reverse()
             self.pending_columns.append(DevIterator.RainColumn(column_chars, self.terminal, self.config))
-        random.shuffle(self.pending_columns)
 
     def __next__(self) -> str:
         if self.phase == "rain":
             if self.pending_columns and not self.column_delay:
                 for _ in range(random.randint(1, 3)):
                     if self.pending_columns:
-                        self.active_columns.append(self.pending_columns.pop(0))
+                        # pick a random pending column and fill its slot with the last column so the removal is O(1)
+                        index = random.randrange(len(self.pending_columns))
+                        next_column = self.pending_columns[index]
+                        self.pending_columns[index] = self.pending_columns[-1]
+                        self.pending_columns.pop()
+                        self.active_columns.append(next_column)
                 self.column_delay = random.randint(5, 15)
             else:
                 self.column_delay -= 1
+            # finished columns are reset by setup_column, which refills their pending characters, so they remain
+            # active and no filtering of active_columns is needed
             for column in self.active_columns:
                 column.tick()
                 if not column.visible_characters and not column.pending_characters:
                     self.pending_columns.append(column)
                     column.setup_column()
-            self.active_columns = [
-                column for column in self.active_columns if column.visible_characters or column.pending_characters
-            ]
 
             self.update()
             if time.time() - self.rain_start > self.config.rain_time:
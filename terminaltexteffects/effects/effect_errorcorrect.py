@@ -131,7 +131,8 @@ class ErrorCorrectIterator(BaseEffectIterator[ErrorCorrectConfig]):
         self.pending_chars: list[EffectCharacter] = []
         self.swapped: list[tuple[EffectCharacter, EffectCharacter]] = []
         self.swap_delay = 0
-        self.character_final_color_map: dict[EffectCharacter, Color] = {}
+        self.character_final_color_map: dict[int, Color] = {}
+        self.completed_characters: list[EffectCharacter] = []
         self.build()
 
     def build(self) -> None:
@@ -139,19 +140,46 @@ class ErrorCorrectIterator(BaseEffectIterator[ErrorCorrectConfig]):
         final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
-        for character in self.terminal.get_characters():
-            self.character_final_color_map[character] = final_gradient_mapping[character.input_coord]
-        for character in self.terminal.get_characters():
+        # final colors are keyed by character id, ids are ints so lookups avoid EffectCharacter.__hash__
+        characters = self.terminal.get_characters()
+        self.character_final_color_map = {
+            character.character_id: final_gradient_mapping[character.input_coord] for character in characters
+        }
+        for character in characters:
             spawn_scene = character.animation.new_scene()
-            spawn_scene.add_frame(character.input_symbol, 1, color=self.character_final_color_map[character])
+            spawn_scene.add_frame(
+                character.input_symbol, 1, color=self.character_final_color_map[character.character_id]
+            )
             character.animation.activate_scene(spawn_scene)
             self.terminal.set_character_visibility(character, True)
         all_characters: list[EffectCharacter] = list(self.terminal._input_characters)
+        pair_count = int(self.config.error_pairs * len(all_characters))
+        # with no pairs to swap, the spawn scenes above are all that is needed
+        if not pair_count or len(all_characters) < 2:
+            return
         correcting_gradient = Gradient(self.config.error_color, self.config.correct_color, steps=10)
         block_symbol = "▓"
         block_wipe_start = ("▁", "▂", "▃", "▄", "▅", "▆", "▇", "█")
         block_wipe_end = ("▇", "▆", "▅", "▄", "▃", "▂", "▁")
-        for _ in range(int(self.config.error_pairs * len(self.terminal.get_characters()))):
+        final_gradients: dict[Color, Gradient] = {}
+        # scenes shared by every swapped character are built once and copied into each character's animation
+        no_color = self.terminal.config.no_color
+        use_xterm_colors = self.terminal.config.xterm_colors
+        first_block_wipe_template = animation.Scene(
+            "first_block_wipe", no_color=no_color, use_xterm_colors=use_xterm_colors
+        )
+        for block in block_wipe_start:
+            first_block_wipe_template.add_frame(block, 3, color=self.config.error_color)
+        last_block_wipe_template = animation.Scene(
+            "last_block_wipe", no_color=no_color, use_xterm_colors=use_xterm_colors
+        )
+        for block in block_wipe_end:
+            last_block_wipe_template.add_frame(block, 3, color=self.config.correct_color)
+        correcting_template = animation.Scene("correcting", no_color=no_color, use_xterm_colors=use_xterm_colors)
+        correcting_template.apply_gradient_to_symbols(correcting_gradient, "█", 3)
+        completion_callback = EventHandler.Callback(self._register_completion)
+        Event, Action = EventHandler.Event, EventHandler.Action
+        for _ in range(pair_count):
             if len(all_characters) < 2:
                 break
             char1 = all_characters.pop(random.randrange(len(all_characters)))
@@ -165,69 +193,52 @@ class ErrorCorrectIterator(BaseEffectIterator[ErrorCorrectConfig]):
             self.swapped.append((char1, char2))
             for character in (char1, char2):
                 first_block_wipe = character.animation.new_scene()
+                first_block_wipe.add_frames_from_scene(first_block_wipe_template)
                 last_block_wipe = character.animation.new_scene()
-                for block in block_wipe_start:
-                    first_block_wipe.add_frame(block, 3, color=self.config.error_color)
-                for block in block_wipe_end:
-                    last_block_wipe.add_frame(block, 3, color=self.config.correct_color)
+                last_block_wipe.add_frames_from_scene(last_block_wipe_template)
                 initial_scene = character.animation.new_scene()
                 initial_scene.add_frame(character.input_symbol, 1, color=self.config.error_color)
                 character.animation.activate_scene(initial_scene)
                 error_scene = character.animation.new_scene(id="error")
-                for _ in range(10):
-                    error_scene.add_frame(block_symbol, 3, color=self.config.error_color)
-                    error_scene.add_frame(character.input_symbol, 3, color=Color("ffffff"))
+                error_scene.add_frame(block_symbol, 3, color=self.config.error_color)
+                error_scene.add_frame(character.input_symbol, 3, color=Color("ffffff"))
+                error_scene.repeat_frames(10)
                 correcting_scene = character.animation.new_scene(sync=animation.SyncMetric.DISTANCE)
-                correcting_scene.apply_gradient_to_symbols(correcting_gradient, "█", 3)
+                correcting_scene.add_frames_from_scene(correcting_template)
                 final_scene = character.animation.new_scene()
-                char_final_gradient = Gradient(
-                    self.config.correct_color, self.character_final_color_map[character], steps=10
-                )
-                final_scene.apply_gradient_to_symbols(char_final_gradient, character.input_symbol, 3)
+                final_color = self.character_final_color_map[character.character_id]
+                if final_color not in final_gradients:
+                    final_gradients[final_color] = Gradient(self.config.correct_color, final_color, steps=10)
+                final_scene.apply_gradient_to_symbols(final_gradients[final_color], character.input_symbol, 3)
                 input_coord_path = character.motion.query_path("input_coord")
-                character.event_handler.register_event(
-                    EventHandler.Event.SCENE_COMPLETE,
-                    error_scene,
-                    EventHandler.Action.ACTIVATE_SCENE,
-                    first_block_wipe,
-                )
-                character.event_handler.register_event(
-                    EventHandler.Event.SCENE_COMPLETE,
-                    first_block_wipe,
-                    EventHandler.Action.ACTIVATE_SCENE,
-                    correcting_scene,
-                )
-                character.event_handler.register_event(
-                    EventHandler.Event.SCENE_COMPLETE,
-                    first_block_wipe,
-                    EventHandler.Action.ACTIVATE_PATH,
-                    input_coord_path,
-                )
-                character.event_handler.register_event(
-                    EventHandler.Event.PATH_ACTIVATED,
-                    input_coord_path,
-                    EventHandler.Action.SET_LAYER,
-                    1,
-                )
-                character.event_handler.register_event(
-                    EventHandler.Event.PATH_COMPLETE,
-                    input_coord_path,
-                    EventHandler.Action.SET_LAYER,
-                    0,
+                character.event_handler.register_events(
+                    [
+                        (Event.SCENE_COMPLETE, error_scene, Action.ACTIVATE_SCENE, first_block_wipe),
+                        (Event.SCENE_COMPLETE, first_block_wipe, Action.ACTIVATE_SCENE, correcting_scene),
+                        (Event.SCENE_COMPLETE, first_block_wipe, Action.ACTIVATE_PATH, input_coord_path),
+                        (Event.PATH_ACTIVATED, input_coord_path, Action.SET_LAYER, 1),
+                        (Event.PATH_COMPLETE, input_coord_path, Action.SET_LAYER, 0),
+                        (Event.PATH_COMPLETE, input_coord_path, Action.ACTIVATE_SCENE, last_block_wipe),
+                        (Event.SCENE_COMPLETE, last_block_wipe, Action.ACTIVATE_SCENE, final_scene),
+                        (Event.SCENE_COMPLETE, final_scene, Action.CALLBACK, completion_callback),
+                    ]
                 )
 
-                character.event_handler.register_event(
-                    EventHandler.Event.PATH_COMPLETE,
-                    input_coord_path,
-                    EventHandler.Action.ACTIVATE_SCENE,
-                    last_block_wipe,
-                )
-                character.event_handler.register_event(
-                    EventHandler.Event.SCENE_COMPLETE,
-                    last_block_wipe,
-                    EventHandler.Action.ACTIVATE_SCENE,
-                    final_scene,
-                )
+    def _register_completion(self, character: EffectCharacter) -> None:
+        self.completed_characters.append(character)
+
+    def update(self) -> None:
+        """Run the tick method for all active characters and remove characters that have completed their final scene.
+
+        Completed characters queue themselves when their final scene completes, so the active list does not need to be
+        filtered every frame.
+        """
+        for character in self.active_characters:
+            character.tick()
+        if self.completed_characters:
+            for character in self.completed_characters:
+                self.active_characters.remove(character)
+            self.completed_characters.clear()
 
     def __next__(self) -> str:
         if self.swapped and not self.swap_delay:
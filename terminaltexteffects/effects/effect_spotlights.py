@@ -8,6 +8,8 @@ Classes:
 
 from __future__ import annotations
 
+import bisect
+import math
 import random
 import typing
 from dataclasses import dataclass
@@ -21,6 +23,11 @@ from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, arg
 from terminaltexteffects.utils.geometry import Coord
 from terminaltexteffects.utils.graphics import Color, Gradient
 
+# number of discrete brightness levels used for characters in the beam falloff
+_BRIGHTNESS_BUCKETS = 32
+# lowest bucket whose brightness is not below the 0.2 used for unlit characters
+_MIN_BRIGHTNESS_BUCKET = math.ceil(0.2 * _BRIGHTNESS_BUCKETS)
+
 
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
     return Spotlights, SpotlightsConfig
@@ -128,16 +135,43 @@ class SpotlightsConfig(ArgsDataClass):
 
 
 class SpotlightsIterator(BaseEffectIterator[SpotlightsConfig]):
+    # the base iterator keeps its attributes in __dict__, the attributes used while running the effect are slots
+    __slots__ = (
+        "pending_chars",
+        "illuminated_indices",
+        "_indices_buffer",
+        "_circle_offset_cache",
+        "spotlights",
+        "_illuminable_characters",
+        "_illuminable_coords",
+        "_illuminable_colors",
+        "_illuminable_color_indices",
+        "_falloff_colors",
+        "_indices_by_column",
+        "illuminate_range",
+        "search_duration",
+        "searching",
+        "complete",
+    )
+
     def __init__(self, effect: "Spotlights") -> None:
         super().__init__(effect)
         self.pending_chars: list[EffectCharacter] = []
-        self.illuminated_chars: set[EffectCharacter] = set()
-        self.character_color_map: dict[EffectCharacter, tuple[Color, Color]] = {}  # (bright, dark)
+        # indices into the illuminable character lists built in build()
+        self.illuminated_indices: set[int] = set()
+        # the set filled with the next frame's indices, swapped with illuminated_indices each frame
+        self._indices_buffer: set[int] = set()
+        # (column offset, max row offset) spans of the spotlight circle, keyed by radius
+        self._circle_offset_cache: dict[int, list[tuple[int, int]]] = {}
         self.build()
 
     def make_spotlights(self, num_spotlights: int) -> list[EffectCharacter]:
         spotlights: list[EffectCharacter] = []
         minimum_distance = self.terminal.canvas.right // 4
+        # the speed bounds and sampler are bound once, speeds are still drawn in path order so the random sequence
+        # interleaves with the bezier control coords as before
+        search_speed_min, search_speed_max = self.config.search_speed_range
+        uniform = random.uniform
         for _ in range(num_spotlights):
             spotlight = self.terminal.add_character("O", self.terminal.canvas.random_coord(outside_scope=True))
             spotlights.append(spotlight)
@@ -153,7 +187,7 @@ class SpotlightsIterator(BaseEffectIterator[SpotlightsConfig]):
             paths: list[motion.Path] = []
             for coord in spotlight_target_coords:
                 path = spotlight.motion.new_path(
-                    speed=random.uniform(self.config.search_speed_range[0], self.config.search_speed_range[1]),
+                    speed=uniform(search_speed_min, search_speed_max),
                     ease=easing.in_out_quad,
                     id=str(len(paths)),
                 )
@@ -167,51 +201,100 @@ class SpotlightsIterator(BaseEffectIterator[SpotlightsConfig]):
         return spotlights
 
     def find_coord_at_minimum_distance(self, origin_coord: Coord, minimum_distance: int) -> Coord:
-        coord_found = False
-        while not coord_found:
-            coord = self.terminal.canvas.random_coord()
-            distance = geometry.find_length_of_line(origin_coord, coord)
-            if distance >= minimum_distance:
-                coord_found = True
-        return coord
-
-    def illuminate_chars(self, range: int) -> None:
-        coords_in_range: list[Coord] = []
+        # candidates are compared on squared integer distance and only the accepted candidate is built into a Coord
+        canvas = self.terminal.canvas
+        minimum_distance_squared = minimum_distance**2
+        while True:
+            column, row = canvas.random_column(), canvas.random_row()
+            if (column - origin_coord.column) ** 2 + (row - origin_coord.row) ** 2 >= minimum_distance_squared:
+                return Coord(column, row)
+
+    def illuminate_chars(self, radius: int) -> None:
+        column_spans = self._circle_offset_cache.get(radius)
+        if column_spans is None:
+            # the radius only changes once the spotlights converge and expand, keep only the current spans
+            self._circle_offset_cache.clear()
+            column_spans = geometry.find_circle_column_spans(radius)
+            self._circle_offset_cache[radius] = column_spans
+        # translate the cached spans to each spotlight and intersect each column span with the rows of that column
+        # that hold a character, overlapping beams are deduplicated by the set
+        indices_by_column = self._indices_by_column
+        indices_in_range = self._indices_buffer
+        bisect_left, bisect_right = bisect.bisect_left, bisect.bisect_right
         for spotlight in self.spotlights:
-            coords_in_range.extend(geometry.find_coords_in_circle(spotlight.motion.current_coord, range))
-        chars_in_range: set[EffectCharacter] = set()
-        for coord in coords_in_range:
-            character = self.terminal.get_character_by_input_coord(coord)
-            if character and character.input_symbol != " ":
-                chars_in_range.add(character)
-        chars_no_longer_in_range = self.illuminated_chars - chars_in_range
-        for character in chars_no_longer_in_range:
-            character.animation.set_appearance(
-                character.input_symbol,
-                self.character_color_map[character][1],
-            )
-
-        for character in chars_in_range:
-            distance = min(
-                [
-                    geometry.find_length_of_line(
-                        spotlight.motion.current_coord, character.input_coord, double_row_diff=True
-                    )
-                    for spotlight in self.spotlights
-                ]
-            )
-
-            if distance > range * (1 - self.config.beam_falloff):
-                brightness_factor = max(
-                    1 - (distance - range * (1 - self.config.beam_falloff)) / (range * self.config.beam_falloff), 0.2
-                )
-                adjusted_color = animation.Animation.adjust_color_brightness(
-                    self.character_color_map[character][0], brightness_factor
-                )
+            center_column, center_row = spotlight.motion.current_coord.column, spotlight.motion.current_coord.row
+            for column_offset, max_row_offset in column_spans:
+                column_indices = indices_by_column.get(center_column + column_offset)
+                if column_indices:
+                    rows, indices = column_indices
+                    start = bisect_left(rows, center_row - max_row_offset)
+                    end = bisect_right(rows, center_row + max_row_offset)
+                    indices_in_range.update(indices[start:end])
+        illuminable_characters = self._illuminable_characters
+        illuminable_coords = self._illuminable_coords
+        illuminable_colors = self._illuminable_colors
+        # the previous frame's set becomes the buffer for the next frame, so reduce it in place to the characters that
+        # left the beam
+        indices_no_longer_in_range = self.illuminated_indices
+        indices_no_longer_in_range.difference_update(indices_in_range)
+        # the symbol never changes, so the appearance only needs to be set if the color is not already applied
+        for index in indices_no_longer_in_range:
+            character = illuminable_characters[index]
+            color_dark = illuminable_colors[index][1]
+            if character.animation.current_character_visual.color is not color_dark:
+                character.animation.set_appearance(character.input_symbol, color_dark)
+
+        # spotlight positions are unpacked once per frame rather than once per character, row differences are doubled
+        # to account for the terminal character height/width ratio, matching find_length_of_line(double_row_diff=True)
+        spotlight_coords = [
+            (spotlight.motion.current_coord.column, spotlight.motion.current_coord.row) for spotlight in self.spotlights
+        ]
+        sqrt, inf = math.sqrt, math.inf
+        # distance from the spotlight where the brightness begins to fall off, and the width of the falloff
+        falloff_start = radius * (1 - self.config.beam_falloff)
+        falloff_start_squared = falloff_start * falloff_start
+        falloff_width = radius * self.config.beam_falloff
+        illuminable_color_indices = self._illuminable_color_indices
+        falloff_colors = self._falloff_colors
+        adjust_color_brightness = animation.Animation.adjust_color_brightness
+        for index in indices_in_range:
+            column, row = illuminable_coords[index]
+            # the nearest spotlight is found on squared distance, the square root is only taken in the falloff ring
+            distance_squared = inf
+            for spotlight_column, spotlight_row in spotlight_coords:
+                column_diff = column - spotlight_column
+                row_diff = 2 * (row - spotlight_row)
+                spotlight_distance_squared = column_diff * column_diff + row_diff * row_diff
+                if spotlight_distance_squared < distance_squared:
+                    distance_squared = spotlight_distance_squared
+
+            color_bright = illuminable_colors[index][0]
+            if distance_squared > falloff_start_squared:
+                distance = sqrt(distance_squared)
+                # beyond the falloff start the factor is always below 1, so only the lower bound needs clamping
+                brightness_factor = 1 - (distance - falloff_start) / falloff_width
+                if brightness_factor <= 0.2:
+                    # the clamped brightness is the unlit color
+                    adjusted_color = illuminable_colors[index][1]
+                else:
+                    # quantize the brightness to the nearest bucket so the adjusted colors can be reused across
+                    # characters and frames, without rounding below the unlit brightness
+                    brightness_bucket = int(brightness_factor * _BRIGHTNESS_BUCKETS + 0.5)
+                    if brightness_bucket < _MIN_BRIGHTNESS_BUCKET:
+                        brightness_bucket = _MIN_BRIGHTNESS_BUCKET
+                    color_falloff_colors = falloff_colors[illuminable_color_indices[index]]
+                    cached_color = color_falloff_colors[brightness_bucket]
+                    if cached_color is None:
+                        cached_color = adjust_color_brightness(color_bright, brightness_bucket / _BRIGHTNESS_BUCKETS)
+                        color_falloff_colors[brightness_bucket] = cached_color
+                    adjusted_color = cached_color
             else:
-                adjusted_color = self.character_color_map[character][0]
-            character.animation.set_appearance(character.input_symbol, adjusted_color)
-        self.illuminated_chars = chars_in_range
+                adjusted_color = color_bright
+            character = illuminable_characters[index]
+            if character.animation.current_character_visual.color is not adjusted_color:
+                character.animation.set_appearance(character.input_symbol, adjusted_color)
+        indices_no_longer_in_range.clear()
+        self.illuminated_indices, self._indices_buffer = indices_in_range, indices_no_longer_in_range
 
     def build(self) -> None:
         self.spotlights: list[EffectCharacter] = self.make_spotlights(self.config.spotlight_count)
@@ -219,12 +302,42 @@ class SpotlightsIterator(BaseEffectIterator[SpotlightsConfig]):
         final_gradient_mapping = final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
-        for character in self.terminal.get_characters():
+        input_characters = self.terminal.get_characters()
+        character_color_map: dict[EffectCharacter, tuple[Color, Color]] = {}  # (bright, dark)
+        for character in input_characters:
             color_bright = final_gradient_mapping[character.input_coord]
             self.terminal.set_character_visibility(character, True)
             color_dark = animation.Animation.adjust_color_brightness(color_bright, 0.2)
-            self.character_color_map[character] = (color_bright, color_dark)
+            character_color_map[character] = (color_bright, color_dark)
             character.animation.set_appearance(character.input_symbol, color_dark)
+        # the coordinate mapping covers the whole canvas and is not needed once every character has its colors
+        del final_gradient_mapping, final_gradient
+        # characters that can be illuminated are stored as parallel lists, sorted by row, so the per frame work only
+        # deals with indices and plain values. indices are also grouped by column with the matching rows for bisection.
+        self._illuminable_characters: list[EffectCharacter] = sorted(
+            (character for character in input_characters if character.input_symbol != " "),
+            key=lambda character: character.input_coord.row,
+        )
+        self._illuminable_coords: list[tuple[int, int]] = [
+            (character.input_coord.column, character.input_coord.row) for character in self._illuminable_characters
+        ]
+        self._illuminable_colors: list[tuple[Color, Color]] = [
+            character_color_map[character] for character in self._illuminable_characters
+        ]
+        # brightness adjusted colors are filled in lazily. they are stored per unique bright color and indexed by
+        # brightness bucket, so lookups never hash a Color
+        color_indices: dict[Color, int] = {}
+        self._illuminable_color_indices: list[int] = [
+            color_indices.setdefault(color_bright, len(color_indices)) for color_bright, _ in self._illuminable_colors
+        ]
+        self._falloff_colors: list[list[Color | None]] = [
+            [None] * (_BRIGHTNESS_BUCKETS + 1) for _ in range(len(color_indices))
+        ]
+        self._indices_by_column: dict[int, tuple[list[int], list[int]]] = {}
+        for index, (column, row) in enumerate(self._illuminable_coords):
+            rows, indices = self._indices_by_column.setdefault(column, ([], []))
+            rows.append(row)
+            indices.append(index)
         self.illuminate_range = int(
             max(
                 min(self.terminal.canvas.right, self.terminal.canvas.top) // self.config.beam_width_ratio,
@@ -249,7 +362,7 @@ class SpotlightsIterator(BaseEffectIterator[SpotlightsConfig]):
                         spotlight_path_center = spotlight.motion.query_path("center")
                         spotlight.motion.activate_path(spotlight_path_center)
                     self.searching = False
-            if not any([spotlight.motion.active_path for spotlight in self.spotlights]):
+            if not any(spotlight.motion.active_path for spotlight in self.spotlights):
                 while len(self.spotlights) > 1:
                     self.spotlights.pop()
                 self.illuminate_range += 1
@@ -126,6 +126,8 @@ class Scene:
 
     Methods:
         add_frame: Adds a Frame to the Scene.
+        add_frames_from_scene: Adds a copy of each Frame in another Scene to the Scene.
+        repeat_frames: Repeats the frames in the Scene a number of times.
         activate: Activates the Scene.
         get_next_visual: Gets the next CharacterVisual in the Scene.
         apply_gradient_to_symbols: Applies a gradient effect to a sequence of symbols.
@@ -238,7 +240,40 @@ class Scene:
             color=color,
             _color_code=char_vis_color,
         )
-        frame = Frame(char_vis, duration)
+        self._append_frame(Frame(char_vis, duration))
+
+    def add_frames_from_scene(self, scene: Scene) -> None:
+        """Adds a new Frame to the Scene for each Frame in the given Scene. CharacterVisuals are shared with the given
+        Scene rather than rebuilt, which makes it inexpensive to apply the same template Scene to many characters.
+
+        Args:
+            scene (Scene): the Scene to copy frames from
+        """
+        for frame in scene.frames:
+            self._append_frame(Frame(frame.character_visual, frame.duration))
+
+    def repeat_frames(self, count: int) -> None:
+        """Repeats the frames currently in the Scene so the sequence plays count times in total. The existing Frame
+        objects are reused rather than rebuilt. Frames in a Scene play one at a time and reset their elapsed ticks when
+        complete, so a Frame can safely appear more than once.
+
+        Args:
+            count (int): the total number of times the sequence of frames should play
+
+        Raises:
+            ValueError: if count is less than 1
+        """
+        if count < 1:
+            raise ValueError("count must be greater than 0")
+        for frame in self.frames * (count - 1):
+            self._append_frame(frame)
+
+    def _append_frame(self, frame: Frame) -> None:
+        """Appends a Frame to the Scene and maps each step of its duration to the Frame for easing.
+
+        Args:
+            frame (Frame): the Frame to append
+        """
         self.frames.append(frame)
         for _ in range(frame.duration):
             self.frame_index_map[self.easing_total_steps] = frame
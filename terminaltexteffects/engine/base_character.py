@@ -140,6 +140,33 @@ class EventHandler:
             self.registered_events[new_event] = list()
         self.registered_events[new_event].append(new_action)
 
+    def register_events(
+        self,
+        events: typing.Iterable[
+            tuple[
+                Event,
+                animation.Scene | motion.Waypoint | motion.Path,
+                Action,
+                animation.Scene | motion.Waypoint | motion.Path | int | Coord | Callback,
+            ]
+        ],
+    ) -> None:
+        """Registers multiple events to be handled by the EventHandler. Equivalent to calling register_event for each
+        (event, caller, action, target) tuple, in order.
+
+        Args:
+            events (typing.Iterable[tuple[Event, caller, Action, target]]): The events to register. Each tuple takes
+                the same arguments as register_event.
+
+        Example:
+            Register events to activate a Path and set the layer when a Scene is complete:
+            `event_handler.register_events([(Event.SCENE_COMPLETE, scene, Action.ACTIVATE_PATH, path),
+            (Event.SCENE_COMPLETE, scene, Action.SET_LAYER, 1)])`
+        """
+        registered_events = self.registered_events
+        for event, caller, action, target in events:
+            registered_events.setdefault((event, caller), []).append((action, target))
+
     def _handle_event(self, event: Event, caller: animation.Scene | motion.Waypoint | motion.Path) -> None:
         """Handles an event by taking the specified action.
 
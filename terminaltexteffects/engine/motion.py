@@ -112,6 +112,8 @@ class Path:
     Methods:
         new_waypoint(coord: Coord, bezier_control: tuple[Coord, ...] | Coord | None = None, id: str = "") -> Waypoint:
             Creates a new Waypoint and appends adds it to the Path.
+        extend_waypoints(coords: typing.Iterable[Coord]) -> list[Waypoint]:
+            Creates a new Waypoint for each coordinate and adds them to the Path in order.
         query_waypoint(waypoint_id: str) -> Waypoint:
             Returns the waypoint with the given waypoint_id.
         step(event_handler: base_character.EventHandler) -> Coord:
@@ -171,6 +173,40 @@ class Path:
         self._add_waypoint_to_path(new_waypoint)
         return new_waypoint
 
+    def extend_waypoints(self, coords: typing.Iterable[Coord]) -> list[Waypoint]:
+        """Creates a new Waypoint for each coordinate and adds them to the Path in order. The total distance and
+        maximum steps are updated once after all waypoints have been added.
+
+        Args:
+            coords (typing.Iterable[Coord]): coordinates for the new waypoints
+
+        Returns:
+            list[Waypoint]: The new waypoints.
+        """
+        new_waypoints: list[Waypoint] = []
+        waypoints = self.waypoints
+        waypoint_lookup = self.waypoint_lookup
+        segments = self.segments
+        find_length_of_line = geometry.find_length_of_line
+        next_id = len(waypoints)
+        for coord in coords:
+            waypoint_id = f"{next_id}"
+            while waypoint_id in waypoint_lookup:
+                next_id += 1
+                waypoint_id = f"{next_id}"
+            next_id += 1
+            waypoint = Waypoint(waypoint_id, coord)
+            waypoint_lookup[waypoint_id] = waypoint
+            if waypoints:
+                previous_waypoint = waypoints[-1]
+                distance_from_previous = find_length_of_line(previous_waypoint.coord, coord)
+                self.total_distance += distance_from_previous
+                segments.append(Segment(previous_waypoint, waypoint, distance_from_previous))
+            waypoints.append(waypoint)
+            new_waypoints.append(waypoint)
+        self.max_steps = round(self.total_distance / self.speed)
+        return new_waypoints
+
     def _add_waypoint_to_path(self, waypoint: Waypoint) -> None:
         """Adds a waypoint to the path and updates the total distance and maximum steps.
 
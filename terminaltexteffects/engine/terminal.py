@@ -8,13 +8,14 @@ Classes:
 
 from __future__ import annotations
 
+import operator
 import random
 import shutil
 import sys
 import time
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Literal
+from typing import Iterable, Literal
 
 import terminaltexteffects.utils.argvalidators as argvalidators
 from terminaltexteffects.engine.base_character import EffectCharacter
@@ -236,6 +237,7 @@ class Terminal:
         get_characters_grouped(grouping: CharacterGroup = CharacterGroup.ROW_TOP_TO_BOTTOM, input_characters: bool = True, fill_chars: bool = False, added_chars: bool = False) -> list[list[EffectCharacter]]: Get a list of all EffectCharacters grouped by the specified CharacterGroup grouping.
         get_character_by_input_coord(coord: Coord) -> EffectCharacter | None: Get an EffectCharacter by its input coordinates.
         set_character_visibility(character: EffectCharacter, is_visible: bool): Set the visibility of a character.
+        set_characters_visibility(characters: Iterable[EffectCharacter], is_visible: bool): Set the visibility of multiple characters.
         get_formatted_output_string() -> str: Get the formatted output string based on the current terminal state.
         print(output_string: str, enforce_frame_rate: bool = True): Prints the current terminal state to stdout while preserving the cursor position.
 
@@ -526,11 +528,16 @@ class Terminal:
         """Update the internal representation of the terminal state with the current position
         of all visible characters.
         """
-        rows = [[" " for _ in range(self.visible_right)] for _ in range(self.visible_top)]
-        for character in sorted(self._visible_characters, key=lambda c: c.layer):
-            row = character.motion.current_coord.row
-            column = character.motion.current_coord.column
-            if self.visible_bottom <= row <= self.visible_top and self.visible_left <= column <= self.visible_right:
+        visible_top = self.visible_top
+        visible_bottom = self.visible_bottom
+        visible_right = self.visible_right
+        visible_left = self.visible_left
+        rows = [[" "] * visible_right for _ in range(visible_top)]
+        for character in sorted(self._visible_characters, key=operator.attrgetter("layer")):
+            current_coord = character.motion.current_coord
+            row = current_coord.row
+            column = current_coord.column
+            if visible_bottom <= row <= visible_top and visible_left <= column <= visible_right:
                 rows[row - 1][column - 1] = character.animation.current_character_visual.formatted_symbol
         terminal_state = ["".join(row) for row in rows]
         self.terminal_state = terminal_state
@@ -718,6 +725,22 @@ class Terminal:
         else:
             self._visible_characters.discard(character)
 
+    def set_characters_visibility(self, characters: Iterable[EffectCharacter], is_visible: bool) -> None:
+        """Set the visibility of multiple characters. Equivalent to calling set_character_visibility for each character,
+        but updates the set of visible characters in a single operation.
+
+        Args:
+            characters (Iterable[EffectCharacter]): the characters to set visibility for
+            is_visible (bool): whether the characters should be visible
+        """
+        characters = list(characters)
+        for character in characters:
+            character._is_visible = is_visible
+        if is_visible:
+            self._visible_characters.update(characters)
+        else:
+            self._visible_characters.difference_update(characters)
+
     def get_formatted_output_string(self) -> str:
         """Get the formatted output string based on the current terminal state.
 
@@ -7,6 +7,7 @@ used by effects to enable more complex animations and movement paths.
 Functions:
     find_coords_on_circle: Finds points on a circle given the origin, radius, and number of points.
     find_coords_in_circle: Finds coordinates within an ellipse given the center and major axis length.
+    find_circle_column_spans: Finds the row extent of each column of the ellipse used by find_coords_in_circle.
     find_coords_in_rect: Finds coordinates within a rectangle given the origin and distance.
     find_coord_at_distance: Finds the coordinate at a given distance along a line defined by two coordinates.
     find_coord_on_bezier_curve: Finds points on a quadratic or cubic bezier curve.
@@ -85,18 +86,38 @@ def find_coords_in_circle(center: Coord, diameter: int) -> list[Coord]:
 
     h, k = center.column, center.row
     coords_in_ellipse: list[Coord] = []
-    a_squared = diameter**2
-    b_squared = (diameter / 2) ** 2
 
-    for x in range(h - diameter, h + diameter + 1):
-        x_component = ((x - h) ** 2) / a_squared
-        max_y_offset = int((b_squared * (1 - x_component)) ** 0.5)
+    for x_offset, max_y_offset in find_circle_column_spans(diameter):
+        x = h + x_offset
         for y in range(k - max_y_offset, k + max_y_offset + 1):
             coords_in_ellipse.append(Coord(x, y))
 
     return coords_in_ellipse
 
 
+def find_circle_column_spans(diameter: int) -> list[tuple[int, int]]:
+    """
+    Find the extent of each column of the circle used by find_coords_in_circle, relative to the center. Each column
+    offset is paired with the maximum row offset in that column, and every row offset between -max and max is within
+    the circle. Spans are independent of the center, so they can be computed once and translated to any center.
+
+    Args:
+        diameter (int): The length of the major axis of the circle.
+
+    Returns:
+        list[tuple[int, int]]: A list of (column offset, max row offset) tuples, ordered by column offset.
+    """
+    a_squared = diameter**2
+    b_squared = (diameter / 2) ** 2
+    column_spans: list[tuple[int, int]] = []
+
+    for x_offset in range(-diameter, diameter + 1):
+        x_component = (x_offset**2) / a_squared
+        column_spans.append((x_offset, int((b_squared * (1 - x_component)) ** 0.5)))
+
+    return column_spans
+
+
 def find_coords_in_rect(origin: Coord, distance: int) -> list[Coord]:
     """Find coords that fall within a rectangle with the given origin and distance
     from the origin. Distance specifies the number of units in each direction from the origin.
@@ -234,6 +234,43 @@ class Gradient:
             spectrum.extend(gradient_colors)
         return spectrum
 
+    def get_color_at_coordinate(
+        self, max_row: int, max_column: int, coord: geometry.Coord, direction: "Gradient.Direction"
+    ) -> Color:
+        """Returns the color at a coordinate based on the gradient and a direction. The color is the same as the color
+        for the coordinate in the mapping returned by build_coordinate_color_mapping.
+
+        Evaluating the gradient for individual coordinates avoids building a mapping for the entire canvas when only
+        a few coordinates are needed.
+
+        Args:
+            max_row (int): The maximum row value.
+            max_column (int): The maximum column value.
+            coord (Coord): The coordinate to get the color for.
+            direction (Gradient.Direction): The direction of the gradient.
+
+        Raises:
+            ValueError: If the direction is not a valid Gradient.Direction.
+
+        Returns:
+            Color: The color at the coordinate.
+        """
+        if direction == Gradient.Direction.VERTICAL:
+            fraction = 1.0 if max_row == 0 else coord.row / max_row
+        elif direction == Gradient.Direction.HORIZONTAL:
+            fraction = 1.0 if max_column == 0 else coord.column / max_column
+        elif direction == Gradient.Direction.RADIAL:
+            fraction = geometry.find_normalized_distance_from_center(max_row, max_column, coord)
+        elif direction == Gradient.Direction.DIAGONAL:
+            if max_row == 0 or max_column == 0:
+                fraction = 1.0
+            else:
+                fraction = ((coord.row * 2) + coord.column) / ((max_row * 2) + max_column)
+        else:
+            raise ValueError(f"Invalid gradient direction: {direction}")
+        # coordinates outside the canvas are given the color at the nearest end of the gradient
+        return self.get_color_at_fraction(max(0.0, min(fraction, 1.0)))
+
     def build_coordinate_color_mapping(
         self, max_row: int, max_column: int, direction: "Gradient.Direction"
     ) -> dict[geometry.Coord, Color]:
@@ -76,6 +76,39 @@ def test_scene_add_frame():
     assert frame.character_visual.bold is True
 
 
+def test_scene_add_frames_from_scene():
+    template = Scene(scene_id="template")
+    template.add_frame(symbol="a", duration=2, color=Color("ffffff"))
+    template.add_frame(symbol="b", duration=3, color=Color("000000"))
+    scene = Scene(scene_id="test_scene")
+    scene.add_frames_from_scene(template)
+    assert len(scene.frames) == 2
+    assert scene.easing_total_steps == 5
+    for frame, template_frame in zip(scene.frames, template.frames):
+        assert frame is not template_frame
+        assert frame.character_visual is template_frame.character_visual
+        assert frame.duration == template_frame.duration
+    assert scene.frame_index_map[4] is scene.frames[1]
+
+
+def test_scene_repeat_frames():
+    scene = Scene(scene_id="test_scene")
+    scene.add_frame(symbol="a", duration=2, color=Color("ffffff"))
+    scene.add_frame(symbol="b", duration=1, color=Color("000000"))
+    scene.repeat_frames(3)
+    assert [frame.character_visual.symbol for frame in scene.frames] == ["a", "b"] * 3
+    assert scene.easing_total_steps == 9
+    assert [scene.get_next_visual().symbol for _ in range(9)] == ["a", "a", "b"] * 3
+    assert not scene.frames
+
+
+def test_scene_repeat_frames_invalid_count():
+    scene = Scene(scene_id="test_scene")
+    scene.add_frame(symbol="a", duration=1, color=Color("ffffff"))
+    with pytest.raises(ValueError, match="count must be greater than 0"):
+        scene.repeat_frames(0)
+
+
 def test_scene_add_frame_invalid_duration():
     scene = Scene(scene_id="test_scene")
     with pytest.raises(ValueError, match="duration must be greater than 0"):
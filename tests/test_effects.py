@@ -1,3 +1,6 @@
+import math
+import random
+
 from terminaltexteffects.effects import (
     effect_beams,
     effect_binarypath,
@@ -8,6 +11,7 @@ from terminaltexteffects.effects import (
     effect_colorshift,
     effect_crumble,
     effect_decrypt,
+    effect_dev,
     effect_errorcorrect,
     effect_expand,
     effect_fireworks,
@@ -137,6 +141,34 @@ def test_decrypt_effect() -> None:
             ...
 
 
+def test_dev_effect() -> None:
+    for input_data in test_inputs:
+        effect = effect_dev.Dev(input_data)
+        effect.terminal_config = terminal_config
+        effect.effect_config.rain_time = 1
+        for _ in effect:
+            ...
+
+
+def test_dev_sample_indices_empty() -> None:
+    assert effect_dev._sample_indices(0, effect_dev._SYMBOL_KEEP_LOG) == []
+
+
+def test_dev_sample_indices_ascending_in_range() -> None:
+    random.seed(0)
+    indices = effect_dev._sample_indices(10000, effect_dev._SYMBOL_KEEP_LOG)
+    assert indices == sorted(set(indices))
+    assert all(0 <= index < 10000 for index in indices)
+
+
+def test_dev_sample_indices_frequency() -> None:
+    random.seed(0)
+    count = 200000
+    probability = 1 - math.exp(effect_dev._SYMBOL_KEEP_LOG)
+    hits = len(effect_dev._sample_indices(count, effect_dev._SYMBOL_KEEP_LOG))
+    assert abs(hits / count - probability) < probability * 0.1
+
+
 def test_errorcorrect_effect() -> None:
     for input_data in test_inputs:
         effect = effect_errorcorrect.ErrorCorrect(input_data)
@@ -145,6 +177,18 @@ def test_errorcorrect_effect() -> None:
             ...
 
 
+def test_errorcorrect_effect_canvas_smaller_than_input() -> None:
+    small_terminal_config = TerminalConfig()
+    small_terminal_config.frame_rate = 0
+    small_terminal_config.ignore_terminal_dimensions = True
+    small_terminal_config.canvas_height = 3
+    small_terminal_config.canvas_width = 5
+    effect = effect_errorcorrect.ErrorCorrect(t5)
+    effect.terminal_config = small_terminal_config
+    for _ in effect:
+        ...
+
+
 def test_expand_effect() -> None:
     for input_data in test_inputs:
         effect = effect_expand.Expand(input_data)
@@ -44,3 +44,10 @@ def test_gradient_single_step() -> None:
 def test_gradient_three_colors() -> None:
     g = Gradient(Color("ffffff"), Color("000000"), Color("ffffff"), steps=4)
     assert g.spectrum[0] == Color("ffffff") and g.spectrum[4] == Color("000000") and g.spectrum[-1] == Color("ffffff")
+
+
+def test_gradient_color_at_coordinate_matches_mapping() -> None:
+    g = Gradient(Color("ff0000"), Color("0000ff"), steps=7)
+    for direction in Gradient.Direction:
+        mapping = g.build_coordinate_color_mapping(10, 30, direction)
+        assert all(g.get_color_at_coordinate(10, 30, coord, direction) == color for coord, color in mapping.items())